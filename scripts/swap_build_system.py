@@ -16,14 +16,16 @@ will change the build system in pyproject.toml to:
     build-backend = "..."
 """
 
+import hashlib
+import json
+import os
+import re
 import sys
 import tempfile
 from argparse import ArgumentParser
 from typing import Sequence
 
-import tomlkit
 from pathlib import Path
-from tomlkit import TOMLDocument
 
 SUPPORTED_BUILD_SYSTEMS = {
     "hatch": {
@@ -42,6 +44,24 @@ SUPPORTED_BUILD_SYSTEMS = {
     }
 }
 
+# matches the whole [build-system] table, up to (but not including) the next table header.
+BUILD_SECTION_RE = re.compile(r"^\[build-system\].*?(?=^\[|\Z)", re.MULTILINE | re.DOTALL)
+
+
+def render_build_system(build_system_name: str) -> str:
+    """Render the named build-system as a ready-to-splice TOML block."""
+    build_system = SUPPORTED_BUILD_SYSTEMS[build_system_name]
+    # json.dumps produces valid TOML for these simple strings and string arrays.
+    return (
+        "[build-system]\n"
+        f"requires = {json.dumps(build_system['requires'])}\n"
+        f"build-backend = {json.dumps(build_system['build-backend'])}\n\n"
+    )
+
+
+# freeze the rendered blocks at import time so main() is a lookup + splice.
+RENDERED = {name: render_build_system(name) for name in SUPPORTED_BUILD_SYSTEMS}
+
 
 def main(args: Sequence[str]) -> int:
     """
@@ -55,18 +75,39 @@ def main(args: Sequence[str]) -> int:
                         help="The name of the build system to switch to.")
     settings, remaining_args = parser.parse_known_args(args=args)
 
-    # update pyproject.toml with desired build-system.
+    # update pyproject.toml with desired build-system by splicing in the pre-rendered
+    # block, avoiding a full TOML parse/serialize round trip.
     pyproject_path = settings.pyproject_toml
-    with pyproject_path.open(encoding="utf-8") as f:
-        doc: TOMLDocument = tomlkit.load(f)
-        doc["build-system"]["requires"] = SUPPORTED_BUILD_SYSTEMS[settings.build_system_name]["requires"]
-        doc["build-system"]["build-backend"] = SUPPORTED_BUILD_SYSTEMS[settings.build_system_name]["build-backend"]
+    text = pyproject_path.read_bytes().decode("utf-8")
+    block = RENDERED[settings.build_system_name]
+    new_text, count = BUILD_SECTION_RE.subn(lambda _match: block, text, count=1)
+    if count == 0:
+        errmsg = f"No [build-system] table found in {pyproject_path}."
+        raise ValueError(errmsg)
 
     # write to temporary file then atomically "switch" it with the original using rename.
-    with tempfile.NamedTemporaryFile('wt', dir=pyproject_path.parent, delete=False) as tf:
-        tf.write(tomlkit.dumps(doc))
+    # follow the write/fsync/close/rename/fsync-dir protocol so a crash cannot leave a
+    # zero-byte or stale pyproject.toml behind.
+    payload = new_text.encode("utf-8")
+    want = hashlib.sha256(payload).digest()
+    with tempfile.NamedTemporaryFile('wb', dir=pyproject_path.parent, delete=False) as tf:
+        tf.write(payload)
+        tf.flush()
+        os.fsync(tf.fileno())
         temp_name = Path(tf.name)
-    temp_name.rename(pyproject_path)
+    # read back and verify what landed on disk before replacing the original.
+    got = hashlib.sha256(temp_name.read_bytes()).digest()
+    if got != want:
+        temp_name.unlink()
+        errmsg = f"Write verification failed for {temp_name}, aborting swap."
+        raise RuntimeError(errmsg)
+    os.replace(temp_name, pyproject_path)
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(pyproject_path.parent, os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
     return 0
 
 
@@ -9,21 +9,36 @@ Consider using some of your README.md.
 
 from __future__ import annotations
 
-from importlib import metadata
-from pathlib import Path
-
-import tomlkit
-
-try:
-    # this assumes running in an installed package
-    __version__ = metadata.version(__package__)
-except metadata.PackageNotFoundError:
-    # this should only ever happen in the development environment,
-    # so ok to assume location of pyproject.toml file.
-    # Also assume src/package file layout and this file is in src/package
-    # and pyproject is in the parent directory of src
-    # ../../pyproject.toml
-    pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
-    with pyproject_path.open() as fp:
-        data = tomlkit.loads(fp.read()).value
-        __version__ = data["tool"]["poetry"]["version"] + "dev"
+import functools
+
+
+@functools.cache
+def _resolve_version() -> str:
+    """Resolve the package version once, on first access of __version__."""
+    from importlib import metadata
+
+    try:
+        # this assumes running in an installed package
+        return metadata.version(__package__)
+    except metadata.PackageNotFoundError:
+        # this should only ever happen in the development environment,
+        # so ok to assume location of pyproject.toml file.
+        # Also assume src/package file layout and this file is in src/package
+        # and pyproject is in the parent directory of src
+        # ../../pyproject.toml
+        import tomllib
+        from pathlib import Path
+
+        pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
+        with pyproject_path.open("rb") as fp:
+            data = tomllib.load(fp)
+            return data["tool"]["poetry"]["version"] + "dev"
+
+
+def __getattr__(name: str) -> str:
+    # PEP 562 lazy attribute: importing the package no longer pays for the
+    # metadata scan (or dev-mode pyproject.toml parse) unless __version__ is used.
+    if name == "__version__":
+        globals()["__version__"] = _resolve_version()
+        return globals()["__version__"]
+    raise AttributeError(name)
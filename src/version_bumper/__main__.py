@@ -18,20 +18,25 @@ Finally, add your application into the main() method.
 
 from __future__ import annotations
 
+import importlib
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from loguru import logger
-
 from version_bumper.clibones.application_settings import ApplicationSettings
-from version_bumper.commands import bump_command, get_command, release_command, set_command, version_command
-from version_bumper.version import Version
 
 if TYPE_CHECKING:
     import argparse
     from collections.abc import Sequence
 
+# command names accepted by main(); each maps to the "{name}_command" function
+# in version_bumper.commands, which is imported lazily so quick-exit paths
+# (--version, --longhelp) do not pay for the command dependency graph.
+_COMMANDS: frozenset[str] = frozenset({"set", "get", "bump", "release", "version"})
+
+# default pyproject.toml path shared by every subcommand's --pyproject option.
+_DEFAULT_PYPROJECT = Path("pyproject.toml")
+
 
 # noinspection PyMethodMayBeStatic
 class Settings(ApplicationSettings):
@@ -91,6 +96,9 @@ class Settings(ApplicationSettings):
         :param parser: the argument parser with --conf_file already added.
         :param defaults: the default dictionary usually loaded from a config file
         """
+        # imported here instead of at module scope so quick-exit paths skip the import
+        from version_bumper.version import Version
+
         # use normal argparse commands to add arguments to the given parser.  Example:
 
         def add_common_arguments(_parser: argparse.ArgumentParser) -> None:
@@ -100,7 +108,7 @@ class Settings(ApplicationSettings):
             _parser.add_argument(
                 "--pyproject",
                 dest="pyproject_toml_path",
-                default=Path("pyproject.toml"),
+                default=_DEFAULT_PYPROJECT,
                 type=Path,
                 action="store",
                 help="pyproject.toml file update the version within.",
@@ -195,20 +203,15 @@ def main(args: list[str] | None = None) -> int:
         if settings.quick_exit:
             return 0
 
-        commands = {
-            "set": set_command,
-            "get": get_command,
-            "bump": bump_command,
-            "release": release_command,
-            "version": version_command,
-        }
-
         try:
-            commands[settings.command](settings)
-        except ValueError as ex:
-            logger.error(ex)
-            return 1
-        except FileNotFoundError as ex:
+            if settings.command not in _COMMANDS:
+                errmsg = f"Invalid command: {settings.command}"
+                raise ValueError(errmsg)
+            commands = importlib.import_module("version_bumper.commands")
+            getattr(commands, f"{settings.command}_command")(settings)
+        except (ValueError, FileNotFoundError) as ex:
+            from loguru import logger
+
             logger.error(ex)
             return 1
     return 0
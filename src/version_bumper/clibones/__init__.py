@@ -32,8 +32,6 @@ So in general, for each command line argument you ought to:
 
 Refer to `application_settings.py` which implements help and logging as examples.
 
-The `__example_application()` demonstrates using a `GracefulInterruptHandler` to capture ^C for a main loop.
-
 Next take a look at `main.main()` which demonstrates the use of the Settings context manager.
 
 The `Settings` does have a few extra features including:
@@ -30,7 +30,7 @@ import argparse
 import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from version_bumper.clibones.config_file import ConfigFile
 from version_bumper.clibones.info_control import InfoControl
@@ -65,6 +65,11 @@ class ApplicationSettings(ABC):
             pass
     """
 
+    # parser construction (subparsers, dozens of Action objects) is costly when
+    # parse() is called repeatedly (tests, long-running drivers), so cache the
+    # built parser per settings class and defaults.
+    _parser_cache: ClassVar[dict[tuple[Any, ...], argparse.ArgumentParser]] = {}
+
     def __init__(
         self,
         app_name: str,
@@ -90,14 +95,28 @@ class ApplicationSettings(ABC):
         self._parser: argparse.ArgumentParser | None = None
         self._settings: argparse.Namespace | None = None
         self._remaining_argv: list[str] = []
-        self._persist_keys: set[str] = set()
+        self._persist_keys: frozenset[str] = frozenset()
         self.quick_exit: bool = False
-        self.logger_control = LoggerControl()
-        self.info_control = InfoControl(app_package=app_package)
+        self._logger_control: LoggerControl | None = None
+        self._info_control: InfoControl | None = None
 
         if self.__default_config_file is None:
             self.__default_config_file = Path.home() / ".config" / f"{self.__app_package}.toml"
 
+    @property
+    def logger_control(self) -> LoggerControl:
+        """Lazily construct the logger control on first use."""
+        if self._logger_control is None:
+            self._logger_control = LoggerControl()
+        return self._logger_control
+
+    @property
+    def info_control(self) -> InfoControl:
+        """Lazily construct the info control on first use."""
+        if self._info_control is None:
+            self._info_control = InfoControl(app_package=self.__app_package)
+        return self._info_control
+
     @abstractmethod
     def add_parent_parsers(self) -> list[argparse.ArgumentParser]:  # pragma: no cover
         """
@@ -133,7 +152,7 @@ class ApplicationSettings(ABC):
         return []
 
     def add_persist_keys(self, keys: set[str]) -> None:
-        self._persist_keys |= keys
+        self._persist_keys = self._persist_keys | frozenset(keys)
 
     def parse(self, args: Sequence[str]) -> tuple[argparse.ArgumentParser, argparse.Namespace, list[str]]:
         """
@@ -147,19 +166,32 @@ class ApplicationSettings(ABC):
         config_file.persist_keys = self._persist_keys
         dash_config_parser, remaining_args, defaults = config_file.parser(args=args)
 
-        parser = argparse.ArgumentParser(
-            self.__app_name,
-            parents=[dash_config_parser, *self.add_parent_parsers()],
-            description=self.__app_description,
-        )
-
-        # add arguments to the parser
-        self.info_control.add_arguments(parser=parser)
-        self.logger_control.add_arguments(parser=parser)
-        self.add_arguments(parser=parser, defaults=defaults or {})
-
-        if defaults:
-            parser.set_defaults(**defaults)
+        cache_key: tuple[Any, ...] | None
+        try:
+            cache_key = (type(self), tuple(sorted((defaults or {}).items())))
+            parser = ApplicationSettings._parser_cache.get(cache_key)
+        except TypeError:
+            # a persisted value can be a TOML array or table, which is unorderable or
+            # unhashable; build the parser uncached instead of raising.
+            cache_key = None
+            parser = None
+        if parser is None:
+            parser = argparse.ArgumentParser(
+                self.__app_name,
+                parents=[dash_config_parser, *self.add_parent_parsers()],
+                description=self.__app_description,
+            )
+
+            # add arguments to the parser
+            self.info_control.add_arguments(parser=parser)
+            self.logger_control.add_arguments(parser=parser)
+            self.add_arguments(parser=parser, defaults=defaults or {})
+
+            if defaults:
+                parser.set_defaults(**defaults)
+
+            if cache_key is not None:
+                ApplicationSettings._parser_cache[cache_key] = parser
 
         # drum roll... Perform the parse!
         settings, leftover_args = parser.parse_known_args(args=remaining_args)
@@ -168,7 +200,9 @@ class ApplicationSettings(ABC):
         settings.quick_exit = self.quick_exit
         settings.config_file = config_file.config_filepath
 
-        config_file.save_config_file(vars(settings))
+        # only materialize the persisted keys instead of the whole namespace
+        persisted = {key: getattr(settings, key) for key in self._persist_keys if hasattr(settings, key)}
+        config_file.save_config_file(persisted)
 
         return parser, settings, leftover_args
 
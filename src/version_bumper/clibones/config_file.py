@@ -5,27 +5,50 @@
 from __future__ import annotations
 
 import argparse
+import copy
+import functools
+import importlib
+import tomllib
 from collections.abc import Callable
 from dataclasses import dataclass
 from json import JSONDecodeError
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import tomlkit.parser
-
 from version_bumper.clibones.config_file_base import ConfigFileBase
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
 # ================================================================================
-# Add import of format specific config file then add to SUPPORTED_FORMATS list
-from version_bumper.clibones.json_config_file import JsonConfigFile
-from version_bumper.clibones.toml_config_file import TomlConfigFile
-
-SUPPORTED_FORMATS: list[type[ConfigFileBase]] = [TomlConfigFile, JsonConfigFile]
+# Add format specific config file classes here, keyed by the file extensions they
+# handle.  The modules are imported lazily, on first use of a matching extension,
+# so unused format backends (and their dependencies) never load.
+_LAZY_FORMATS: dict[str, str] = {
+    ".toml": "version_bumper.clibones.toml_config_file:TomlConfigFile",
+    ".tml": "version_bumper.clibones.toml_config_file:TomlConfigFile",
+    ".json": "version_bumper.clibones.json_config_file:JsonConfigFile",
+}
 # ================================================================================
 
+# the options the pre-parse pass owns; argparse abbreviates long options, so any
+# unambiguous prefix of these (e.g. "--conf") must also trigger the pre-parse.
+_CONFIG_OPTION_STRINGS = ("--config", "--save-config", "--save-config-as")
+
+
+def _names_config_option(arg: str) -> bool:
+    """Does the command line token name (possibly abbreviated) one of the config options?"""
+    flag = arg.partition("=")[0]
+    if len(flag) <= 2 or not flag.startswith("--"):
+        return False
+    return any(option.startswith(flag) for option in _CONFIG_OPTION_STRINGS)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_load(path_str: str, mtime_ns: int, size: int, loader: Callable[[Path], dict[str, Any]]) -> dict[str, Any]:
+    """Load keyed on (path, mtime, size) so unchanged files parse only once per process."""
+    return loader(Path(path_str))
+
 
 @dataclass
 class ConfigFile:
@@ -48,23 +71,31 @@ class ConfigFile:
     save_config_filepath: Path | None = None
 
     def __init__(self) -> None:
-        self.registered_formats: dict[
-            str, tuple[Callable[[Path], dict[str, Any]], Callable[[Path, dict[str, Any]], None]]
-        ] = {}
-        self.supported_formats: list[type[ConfigFileBase]] = SUPPORTED_FORMATS
-        for supported_format in self.supported_formats:
-            supported_format.register(self)
+        # parallel loader/saver registries keyed by extension, so dispatch is a
+        # single dict lookup instead of a lookup plus tuple index.
+        self._loaders: dict[str, Callable[[Path], dict[str, Any]]] = {}
+        self._savers: dict[str, Callable[[Path, dict[str, Any]], None]] = {}
+        self._loaded_defaults: dict[str, Any] = {}
+
+    def _ensure_registered(self, extension: str) -> None:
+        """import and register the format handler for the given extension, on demand."""
+        if extension in self._loaders or extension not in _LAZY_FORMATS:
+            return
+        module_name, _, class_name = _LAZY_FORMATS[extension].partition(":")
+        config_file_class: type[ConfigFileBase] = getattr(importlib.import_module(module_name), class_name)
+        config_file_class.register(self)
 
     def register(
         self, extension: str, loader: Callable[[Path], dict[str, Any]], saver: Callable[[Path, dict[str, Any]], None]
     ) -> None:
         """register an extension with loader and saver methods."""
-        self.registered_formats[extension] = (loader, saver)
+        self._loaders[extension] = loader
+        self._savers[extension] = saver
 
     @property
     def supported_extensions(self) -> list[str]:
         """return the list of supported extensions. Note the extension includes the leading dot (ex: ".toml")"""
-        return list(self.registered_formats.keys())
+        return list(dict.fromkeys([*_LAZY_FORMATS, *self._loaders]))
 
     def load(self, filepath: Path | None) -> dict[str, Any]:
         """
@@ -75,14 +106,19 @@ class ConfigFile:
         if filepath is None:
             return {}
 
+        suffix = filepath.suffix
+        self._ensure_registered(suffix)
+        loader = self._loaders.get(suffix)
+        if loader is None:
+            errmsg = f"No config file loader found for {filepath}"
+            raise ValueError(errmsg)
         try:
-            return self.registered_formats[filepath.suffix][0](filepath)
+            st = filepath.stat()
+            # deep copy so callers cannot mutate the cached parse
+            return copy.deepcopy(_cached_load(str(filepath), st.st_mtime_ns, st.st_size, loader))
         except ValueError as ex:
             raise ex
-        except KeyError as ex:
-            errmsg = f"No config file loader found for {filepath}"
-            raise ValueError(errmsg) from ex
-        except (JSONDecodeError, tomlkit.parser.ParseError, TypeError) as ex:
+        except (JSONDecodeError, tomllib.TOMLDecodeError, TypeError) as ex:
             errmsg = f"The config file ({filepath}) could not be loaded: {ex}"
             raise ValueError(errmsg) from ex
 
@@ -95,36 +131,42 @@ class ConfigFile:
         if not isinstance(config_dict, dict):
             errmsg = f"The config file ({filepath}) must be a dictionary"  # type: ignore[unreachable]
             raise ValueError(errmsg)
+        suffix = filepath.suffix
+        self._ensure_registered(suffix)
+        saver = self._savers.get(suffix)
+        if saver is None:
+            errmsg = f"No config file saver found for {filepath}"
+            raise ValueError(errmsg)
         try:
-            self.registered_formats[filepath.suffix][1](filepath, config_dict)
+            saver(filepath, config_dict)
         except ValueError as ex:
             raise ex
-        except KeyError as ex:
-            errmsg = f"No config file saver found for {filepath}"
-            raise ValueError(errmsg) from ex
-        except (JSONDecodeError, tomlkit.parser.ParseError, TypeError) as ex:
+        except (JSONDecodeError, TypeError) as ex:
             errmsg = f"Cannot convert the data to the format of the config file {filepath}: {ex}"
             raise ValueError(errmsg) from ex
 
     def parser(self, args: Sequence[str]) -> tuple[argparse.ArgumentParser, Sequence[str], dict[str, Any] | None]:
         config_parser_help = f"Configuration file (default: {self.default_config_file})"
         dash_config_parser: argparse.ArgumentParser = argparse.ArgumentParser(add_help=False)
-        dash_config_parser.add_argument("--config", metavar="FILE", help=config_parser_help)
+        dash_config_parser.add_argument("--config", metavar="FILE", type=Path, help=config_parser_help)
         dash_config_parser.add_argument(
             "--save-config", dest="save_config", action="store_true", help=config_parser_help
         )
-        dash_config_parser.add_argument("--save-config-as", metavar="FILE", help=config_parser_help)
-        parse_args, remaining_args = dash_config_parser.parse_known_args(args=args)
+        dash_config_parser.add_argument("--save-config-as", metavar="FILE", type=Path, help=config_parser_help)
+        if any(_names_config_option(arg) for arg in args):
+            parse_args, remaining_args = dash_config_parser.parse_known_args(args=args)
+        else:
+            # fast path: no config options on the command line, so skip the pre-parse
+            # pass entirely and let the main parser make the single full pass.
+            parse_args = argparse.Namespace(config=None, save_config=False, save_config_as=None)
+            remaining_args = args
 
         # desired config files may also be located in self.__config_files and in self._default_config_files(),
         # so combine the three possible sources with the "--config FILE" being first in the list.
-        self.config_filepath = self.default_config_file
-        if parse_args.config:
-            self.config_filepath = Path(parse_args.config)
-        if parse_args.save_config:
-            self.save_config_filepath = self.config_filepath
-        if parse_args.save_config_as:
-            self.save_config_filepath = Path(parse_args.save_config_as)
+        self.config_filepath = parse_args.config or self.default_config_file
+        self.save_config_filepath = parse_args.save_config_as or (
+            self.config_filepath if parse_args.save_config else None
+        )
 
         defaults: dict[str, Any] = {}
         if self.config_filepath is not None:
@@ -135,13 +177,15 @@ class ConfigFile:
             except FileNotFoundError:
                 # the config file doesn't exist, which is ok and means no defaults...
                 pass
+        self._loaded_defaults = dict(defaults)
         return dash_config_parser, remaining_args, defaults
 
     @staticmethod
     def filter_keys(data: dict[str, Any], persist_keys: set[str], filtered_data: dict[str, Any]) -> dict[str, Any]:
-        for key in data:
-            if key in persist_keys:
-                filtered_data[key] = data[key]
+        if not persist_keys:
+            return filtered_data
+        # C-level hash join instead of a Python membership loop
+        filtered_data.update((key, data[key]) for key in persist_keys & data.keys())
         return filtered_data
 
     def save_config_file(self, settings: dict[str, Any]) -> None:
@@ -152,6 +196,10 @@ class ConfigFile:
                     if key in settings:
                         data[key] = settings[key]
 
+            # skip the rewrite when saving to the same file we loaded and nothing changed.
+            if self.save_config_filepath == self.config_filepath and data == self._loaded_defaults:
+                return
+
             self.save(
                 filepath=self.save_config_filepath, config_dict={self.section_name or "missing section_name": data}
             )
@@ -9,8 +9,6 @@ from dataclasses import dataclass
 from importlib import metadata
 from typing import TYPE_CHECKING
 
-from loguru import logger
-
 if TYPE_CHECKING:
     import argparse
     from argparse import ArgumentParser
@@ -47,6 +45,8 @@ class InfoControl:
 
     def setup(self, settings: argparse.Namespace) -> None:
         """Set up the given settings.  In this case, handle the --version and --longhelp options."""
+        from loguru import logger
+
         if settings.longhelp and self.app_package:
             logger.info(self._load_longhelp())
             settings.quick_exit = True
@@ -62,7 +62,16 @@ class InfoControl:
 
         :return: the version string or DEFAULT_VERSION
         """
+        from loguru import logger
+
         if self.app_package:
+            try:
+                # a build-time generated version constant (e.g. from hatch-vcs or
+                # setuptools-scm) is a constant-time read, so prefer it over the
+                # dist-info directory scan that metadata.version performs.
+                return str(importlib.import_module(f"{self.app_package}._version").__version__)
+            except (ImportError, AttributeError, TypeError, ValueError):
+                pass
             try:
                 return metadata.version(self.app_package)
             except (ImportError, importlib.metadata.PackageNotFoundError):
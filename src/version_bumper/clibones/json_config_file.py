@@ -5,6 +5,8 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
 import tempfile
 from pathlib import Path
 from typing import Any
@@ -19,8 +21,14 @@ class JsonConfigFile(ConfigFileBase):
 
     @staticmethod
     def load(filepath: Path) -> dict[str, Any]:
-        with filepath.open(encoding="utf-8") as f:
-            data = json.load(f)
+        with filepath.open("rb") as f:
+            # map the file and hand the parser one contiguous buffer instead of
+            # letting it do many small buffered reads.  mmap rejects empty files.
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data = json.loads(mm.read())
+            else:
+                data = json.load(f)
             if isinstance(data, dict):
                 return data
             errmsg = f'Data loaded from "{filepath}" is not a dictionary.'
@@ -28,8 +36,19 @@ class JsonConfigFile(ConfigFileBase):
 
     @staticmethod
     def save(filepath: Path, config_dict: dict[str, Any]) -> None:
-        # write to temporary file then atomically "switch" it with the original using rename.
-        with tempfile.NamedTemporaryFile("wt", dir=filepath.parent, delete=False) as tf:
-            tf.write(json.dumps(config_dict))
-            temp_name = Path(tf.name)
-        temp_name.rename(filepath)
+        # write to temporary file then atomically "switch" it with the original using
+        # os.replace (atomic on POSIX and Windows), fsyncing first so a crash cannot
+        # leave a truncated config behind.
+        # serialize without the ASCII-escape pass and write the bytes directly.
+        tmp_path: str | None = None
+        try:
+            with tempfile.NamedTemporaryFile("wb", dir=filepath.parent, delete=False) as tf:
+                tmp_path = tf.name
+                tf.write(json.dumps(config_dict, ensure_ascii=False).encode("utf-8"))
+                tf.flush()
+                os.fsync(tf.fileno())
+            os.replace(tmp_path, os.fspath(filepath))
+        except Exception:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
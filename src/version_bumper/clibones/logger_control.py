@@ -7,10 +7,7 @@ from __future__ import annotations
 import argparse
 import sys
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any
-
-from loguru import logger
-from pathvalidate.argparse import validate_filepath_arg
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from argparse import ArgumentParser
@@ -42,6 +39,8 @@ class LoggerControl:
     # noinspection PyMethodMayBeStatic
     def add_arguments(self, parser: ArgumentParser) -> None:
         """Use argparse commands to add arguments to the given parser."""
+        # deferred import: pathvalidate is only needed when building the parser
+        from pathvalidate.argparse import validate_filepath_arg
 
         output_group = parser.add_argument_group(title="Logging Options", description="output_group")
 
@@ -77,34 +76,33 @@ class LoggerControl:
 
     @staticmethod
     def setup(settings: argparse.Namespace) -> None:
-        level = "INFO"
-        error_messages = []
+        # deferred import: keep loguru's import cost out of CLI startup until
+        # logging is actually configured
+        from loguru import logger
 
-        # convert settings to dictionary, so we can test if argument was passed
-        settings_dict: dict[str, Any] = vars(settings)
+        error_messages = []
 
         # the order of the loglevel processing is important.
         # --quiet has the highest priority followed by --debug then --loglevel
-        if "loglevel" in settings_dict:
-            level = settings_dict["loglevel"]
-            if level not in LoggerControl.VALID_LOG_LEVELS:
-                error_messages.append(
-                    f"Invalid log level {level}, " f"should be one of the following: {LoggerControl.VALID_LOG_LEVELS}"
-                )
-                level = "INFO"
-
-        if settings_dict.get("debug"):
+        level = getattr(settings, "loglevel", "INFO")
+        if level not in LoggerControl.VALID_LOG_LEVELS:
+            error_messages.append(
+                f"Invalid log level {level}, " f"should be one of the following: {LoggerControl.VALID_LOG_LEVELS}"
+            )
+            level = "INFO"
+
+        if getattr(settings, "debug", False):
             level = "DEBUG"
 
-        if settings_dict.get("quiet"):
+        if getattr(settings, "quiet", False):
             level = "ERROR"
 
         settings.loglevel = level
         logger.remove(None)
         logger.add(sys.stdout, level=settings.loglevel, format=LOGURU_SHORT_FORMAT)
 
-        if settings_dict.get("logfile"):
-            filename = settings_dict["logfile"]
+        filename = getattr(settings, "logfile", None)
+        if filename:
             try:
                 logger.add(filename, level=settings.loglevel)
             except OSError as ex:
@@ -4,12 +4,21 @@
 
 from __future__ import annotations
 
+import mmap
+import os
 import tempfile
+import tomllib
 from pathlib import Path
 from typing import Any
 
 import tomlkit
 
+try:
+    # optional: tomli_w streams the document straight to the file handle
+    import tomli_w
+except ImportError:  # pragma: no cover
+    tomli_w = None  # type: ignore[assignment]
+
 from version_bumper.clibones.config_file_base import ConfigFileBase
 
 
@@ -21,14 +30,35 @@ class TomlConfigFile(ConfigFileBase):
 
     @staticmethod
     def load(filepath: Path) -> dict[str, Any]:
-        with filepath.open(encoding="utf-8") as f:
-            data: dict[str, Any] = tomlkit.load(f).value
+        # read-only path, so use the stdlib C-backed parser instead of tomlkit's
+        # style-preserving (and much slower) one.  Parse from a memory map so the
+        # parser sees one contiguous buffer.  mmap rejects empty files.
+        with filepath.open("rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data: dict[str, Any] = tomllib.load(mm)
+            else:
+                data = tomllib.load(f)
             return data
 
     @staticmethod
     def save(filepath: Path, config_dict: dict[str, Any]) -> None:
-        # write to temporary file then atomically "switch" it with the original using rename.
-        with tempfile.NamedTemporaryFile("wt", dir=filepath.parent, delete=False) as tf:
-            tf.write(tomlkit.dumps(config_dict))
-            temp_name = Path(tf.name)
-        temp_name.rename(filepath)
+        # write to temporary file then atomically "switch" it with the original using
+        # os.replace (atomic on POSIX and Windows), fsyncing first so a crash cannot
+        # leave a truncated config behind.
+        tmp_path: str | None = None
+        try:
+            with tempfile.NamedTemporaryFile("wb", dir=filepath.parent, delete=False) as tf:
+                tmp_path = tf.name
+                if tomli_w is not None:
+                    # stream to the file instead of materializing the whole document
+                    tomli_w.dump(config_dict, tf)
+                else:
+                    tf.write(tomlkit.dumps(config_dict).encode("utf-8"))
+                tf.flush()
+                os.fsync(tf.fileno())
+            os.replace(tmp_path, os.fspath(filepath))
+        except Exception:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
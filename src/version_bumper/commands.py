@@ -6,19 +6,29 @@ from __future__ import annotations
 
 import argparse
 import json
-from pathlib import Path
+from collections.abc import Callable
 
 from loguru import logger
 
 from version_bumper.pyproject import PyProject
 from version_bumper.version import Version
 
+# output format dispatch table: one lookup instead of re-branching on the
+# --json/--text flags in every command's output path.
+_FORMATTERS: dict[str, Callable[[dict[str, str]], str]] = {
+    "json": json.dumps,
+    "text": lambda versions: "\n".join(versions.values()),
+    "default": lambda versions: "\n".join(f"{key}: {value}" for key, value in versions.items()),
+}
+
 
 def version_command(settings: argparse.Namespace) -> None:
     """
     Set the version in the pyproject.toml file.
     """
-    __save_version(pyproject_toml_path=settings.pyproject_toml_path, version=Version(settings.value))
+    # validate the version string before touching the pyproject.toml file
+    version = Version(settings.value)
+    __save_version(pyproject=PyProject(settings.pyproject_toml_path), version=version)
     if not settings.silent:
         __output(settings=settings, versions={"version": str(settings.value)})
 
@@ -27,20 +37,17 @@ def get_command(settings: argparse.Namespace) -> None:
     """
     Get the version (project.version, or tool.poetry.version, or both) from the pyproject.toml file.
     """
-    versions: dict[str, str] = {}
     keys: list[str] = []
+    if settings.project:
+        keys.append("project.version")
+    if settings.poetry:
+        keys.append("tool.poetry.version")
 
-    keys.append("project.version") if settings.project else None
-    keys.append("tool.poetry.version") if settings.poetry else None
-
+    # get never writes the document back, so use the cached read-only parser
     version_list: list[Version | None] = PyProject.load_version(
         pyproject_toml_path=settings.pyproject_toml_path, key_dot_notation_list=keys
     )
-    if settings.project and version_list is not None:
-        versions["project.version"] = str(version_list.pop(0))
-
-    if settings.poetry and version_list is not None:
-        versions["tool.poetry.version"] = str(version_list.pop(0))
+    versions: dict[str, str] = {key: str(version) for key, version in zip(keys, version_list, strict=True)}
     __output(settings=settings, versions=versions)
 
 
@@ -49,7 +56,8 @@ def bump_command(settings: argparse.Namespace) -> None:
     A version consists of several parts: epoch, major, minor, patch, release, a, b, rc, post, dev, and local.
     This method allows incrementing any of the individual parts.
     """
-    version: Version | None = __load_version(settings=settings)
+    pyproject = PyProject(settings.pyproject_toml_path)
+    version: Version | None = __load_version(pyproject=pyproject)
     if version is None:
         errmsg = (
             f"Unable to extract neither project.version nor tool.poetry.version "
@@ -58,7 +66,7 @@ def bump_command(settings: argparse.Namespace) -> None:
         raise ValueError(errmsg)
 
     version.bump(part=settings.part)
-    __save_version(pyproject_toml_path=settings.pyproject_toml_path, version=version)
+    __save_version(pyproject=pyproject, version=version)
     __output(settings=settings, versions={"version": str(version)})
 
 
@@ -67,7 +75,8 @@ def release_command(settings: argparse.Namespace) -> None:
     A release version consists of several parts: epoch, major, minor, and patch.
     This method removes the remaining parts: a, b, rc, post, dev, and local.
     """
-    version: Version | None = __load_version(settings)
+    pyproject = PyProject(settings.pyproject_toml_path)
+    version: Version | None = __load_version(pyproject=pyproject)
     if version is None:
         errmsg = (
             f"Unable to extract neither project.version nor tool.poetry.version "
@@ -76,7 +85,7 @@ def release_command(settings: argparse.Namespace) -> None:
         raise ValueError(errmsg)
 
     version.bump_release()
-    __save_version(pyproject_toml_path=settings.pyproject_toml_path, version=version)
+    __save_version(pyproject=pyproject, version=version)
     __output(settings=settings, versions={"version": str(version)})
 
 
@@ -85,7 +94,8 @@ def set_command(settings: argparse.Namespace) -> None:
     A version consists of several parts: epoch, major, minor, patch, release, a, b, rc, post, dev, and local.
     This method allows setting any of the individual parts.
     """
-    version: Version | None = __load_version(settings)
+    pyproject = PyProject(settings.pyproject_toml_path)
+    version: Version | None = __load_version(pyproject=pyproject)
     if version is None:
         errmsg = (
             f"Unable to extract neither project.version nor tool.poetry.version "
@@ -94,28 +104,21 @@ def set_command(settings: argparse.Namespace) -> None:
         raise ValueError(errmsg)
 
     version.set(part=settings.part, value=settings.value, clear_right=settings.clear_right)
-    __save_version(pyproject_toml_path=settings.pyproject_toml_path, version=version)
+    __save_version(pyproject=pyproject, version=version)
     __output(settings=settings, versions={"version": str(version)})
 
 
-def __save_version(pyproject_toml_path: Path, version: Version) -> None:
+def __save_version(pyproject: PyProject, version: Version) -> None:
     """
     Saves the version to the pyproject.toml file.  Always overwrites the project.version.
     If the pyproject.toml file already has a tool.poetry.version, it will be overwritten,
     but will not be created.
     """
-    # if tool.poetry.version exists, then overwrite it
-    versions: list[Version | None] = PyProject.load_version(
-        pyproject_toml_path=pyproject_toml_path, key_dot_notation_list=["tool.poetry.version"]
-    )
-
-    keys = ["project.version"]
-    if versions[0] is not None:
-        # only update tool.poetry.version, i.e. DO NOT CREATE
-        keys.append("tool.poetry.version")
-
-    # always save to project.version
-    PyProject.save_version(pyproject_toml_path=pyproject_toml_path, key_dot_notation_list=keys, version=version)
+    # reuse the command's already-parsed document: always save project.version, only
+    # update an existing tool.poetry.version (i.e. DO NOT CREATE), then write once.
+    pyproject.set_version("project.version", version)
+    pyproject.set_version("tool.poetry.version", version, create=False)
+    pyproject.save()
 
 
 def __sanity_check_loaded_versions(project_version: Version | None, poetry_version: Version | None) -> Version | None:
@@ -130,17 +133,14 @@ def __sanity_check_loaded_versions(project_version: Version | None, poetry_versi
     return project_version
 
 
-def __load_version(settings: argparse.Namespace) -> Version | None:
+def __load_version(pyproject: PyProject) -> Version | None:
     """
-    Loads the version from the pyproject.toml file.
+    Loads the version from the already-parsed pyproject.toml document.
     """
-    # try to load both project.version and tool.poetry.version
-    versions: list[Version | None] = PyProject.load_version(
-        pyproject_toml_path=settings.pyproject_toml_path,
-        key_dot_notation_list=["project.version", "tool.poetry.version"],
+    # try to load both project.version and tool.poetry.version, then sanity check them
+    return __sanity_check_loaded_versions(
+        pyproject.get_version("project.version"), pyproject.get_version("tool.poetry.version")
     )
-    # sanity check what we loaded
-    return __sanity_check_loaded_versions(versions[0], versions[1])
 
 
 def __output(settings: argparse.Namespace, versions: dict[str, str]) -> None:
@@ -148,10 +148,5 @@ def __output(settings: argparse.Namespace, versions: dict[str, str]) -> None:
     Formats and outputs the version(s) to the logger.  The supported formats are:
     --json, --text, and default, where default is human-readable meant for the console.
     """
-    if settings.json:
-        logger.info(json.dumps(versions))
-    elif settings.text:
-        logger.info("\n".join([str(versions[key]) for key in versions]))
-    else:
-        for key, value in versions.items():
-            logger.info(f"{key}: {value}")
+    output_format = "json" if settings.json else "text" if settings.text else "default"
+    logger.opt(lazy=True).info("{}", lambda: _FORMATTERS[output_format](versions))
@@ -4,7 +4,10 @@
 
 from __future__ import annotations
 
+import os
 import tempfile
+import tomllib
+from functools import lru_cache, reduce
 from pathlib import Path
 from typing import Any
 
@@ -14,45 +17,141 @@ from tomlkit import TOMLDocument
 from version_bumper.version import Version
 
 
+@lru_cache(maxsize=8)
+def _read_only_parse(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """
+    Parse keyed on (path, mtime, size) so repeated read-only loads of an unchanged
+    file parse only once per process.  Uses the stdlib C-backed tomllib parser --
+    an order of magnitude faster than tomlkit's style-preserving one, and style
+    preservation is wasted work on paths that never write the document back.
+    Callers must not mutate the returned dict; the write paths parse their own
+    private tomlkit instance in PyProject.__init__.
+    """
+    return tomllib.loads(Path(path_str).read_bytes().decode("utf-8"))
+
+
 class PyProject:
+    """
+    One parsed pyproject.toml document.  Parsing with tomlkit is the dominant cost of a
+    CLI invocation, so a command should construct a single instance, perform all of its
+    reads and writes against it, then call save() once.  save() only writes when a
+    set_version call actually changed the document.
+
+    The classmethods are thin wrappers kept for one-shot use.
+    """
+
+    def __init__(self, pyproject_toml_path: Path) -> None:
+        """Parse the pyproject.toml file once."""
+        self.pyproject_toml_path = pyproject_toml_path
+        try:
+            # one read syscall, no text-IO layer; decode once and parse from memory
+            text = pyproject_toml_path.read_bytes().decode("utf-8")
+        except FileNotFoundError as ex:
+            errmsg = f'Unable to open "{pyproject_toml_path}" for loading - File not found.'
+            raise FileNotFoundError(errmsg) from ex
+        self._doc: TOMLDocument = tomlkit.loads(text)
+        # kept so save() can skip the rewrite when nothing actually changed
+        self._original_text: str = text
+        self._dirty: bool = False
+
+    def get_version(self, key_dot_notation: str) -> Version | None:
+        """Get the version at the given dotted key, or None if the key is not in the document."""
+        return PyProject._version_at(self._doc, key_dot_notation)
+
+    @staticmethod
+    def _version_at(doc: Any, key_dot_notation: str) -> Version | None:
+        """Walk the dotted key through the given document, parsing the value found there."""
+        field: Any = reduce(lambda field, key: field.get(key), key_dot_notation.split("."), doc)
+        return Version.parse(str(field)) if field is not None else None
+
+    def set_version(self, key_dot_notation: str, version: Version, *, create: bool = True) -> None:
+        """
+        Set the version on the given dotted key.  When create is False the key is only
+        updated if it already exists in the document (i.e. DO NOT CREATE).
+        """
+        keys = key_dot_notation.split(".")
+        field: Any = self._doc
+        if create:
+            for key in keys[:-1]:
+                field = field.get(key)
+        else:
+            for key in keys[:-1]:
+                field = field.get(key) if field is not None else None
+            if field is None or field.get(keys[-1]) is None:
+                return
+        field.update({keys[-1]: str(version)})
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the document back to the pyproject.toml file, only if it was changed."""
+        if not self._dirty:
+            return
+        text = tomlkit.dumps(self._doc)
+        if text == self._original_text:
+            # e.g. setting the version to its current value: skip the open/write/fsync/replace
+            self._dirty = False
+            return
+        try:
+            # write to temporary file then atomically "switch" it with the original using
+            # os.replace (atomic on POSIX and Windows, unlike rename which fails on Windows
+            # when the target exists), fsyncing first so the replace commits durable bytes.
+            # encode once and write binary to skip the text-encoder layer.
+            data = text.encode("utf-8")
+            with tempfile.NamedTemporaryFile("wb", dir=self.pyproject_toml_path.parent, delete=False) as tf:
+                tf.write(data)
+                tf.flush()
+                os.fsync(tf.fileno())
+            os.replace(tf.name, self.pyproject_toml_path)
+        except FileNotFoundError as ex:
+            errmsg = f'Unable to open "{self.pyproject_toml_path}" for saving - File not found.'
+            raise FileNotFoundError(errmsg) from ex
+        self._original_text = text
+        self._dirty = False
+
     @classmethod
     def load_version(cls, pyproject_toml_path: Path, key_dot_notation_list: list[str]) -> list[Version | None]:
         """
         Load the versions specified by a list of dotted keys from the pyproject.toml file.
+        Read-only, so repeated loads of an unchanged file hit the parse cache; a save
+        bumps the file's mtime, which naturally invalidates the cache entry.
         """
-        versions: list[Version | None] = []
         try:
-            with pyproject_toml_path.open(encoding="utf-8") as f:
-                doc: TOMLDocument = tomlkit.load(f)
-                for key_dot_notation in key_dot_notation_list:
-                    field: Any = doc
-                    for key in key_dot_notation.split("."):
-                        field = field.get(key)
-                    versions.append(Version(field) if field is not None else None)
+            file_stat = pyproject_toml_path.stat()
         except FileNotFoundError as ex:
             errmsg = f'Unable to open "{pyproject_toml_path}" for loading - File not found.'
             raise FileNotFoundError(errmsg) from ex
-        return versions
+        doc = _read_only_parse(str(pyproject_toml_path), file_stat.st_mtime_ns, file_stat.st_size)
+        return [cls._version_at(doc, key_dot_notation) for key_dot_notation in key_dot_notation_list]
 
     @classmethod
-    def save_version(cls, pyproject_toml_path: Path, key_dot_notation_list: list[str], version: Version) -> None:
+    def update_version(
+        cls,
+        pyproject_toml_path: Path,
+        version: Version,
+        key_dot_notation_list: list[str],
+        if_present_key_dot_notation_list: list[str] | None = None,
+    ) -> None:
         """
-        Save the version to each of the dotted keys in the given list to the pyproject.toml file.
+        Set the version on the given dotted keys with a single parse and a single write.
+        Keys in key_dot_notation_list are always set; keys in if_present_key_dot_notation_list
+        are only updated when they already exist in the document (i.e. DO NOT CREATE).
         """
         try:
-            with pyproject_toml_path.open(encoding="utf-8") as f:
-                doc: TOMLDocument = tomlkit.load(f)
-                for key_dot_notation in key_dot_notation_list:
-                    field: Any = doc
-                    for key in key_dot_notation.split(".")[:-1]:
-                        field = field.get(key)
-                    field.update({"version": str(version)})
-
-            # write to temporary file then atomically "switch" it with the original using rename.
-            with tempfile.NamedTemporaryFile("wt", dir=pyproject_toml_path.parent, delete=False) as tf:
-                tf.write(tomlkit.dumps(doc))
-                temp_name = Path(tf.name)
-            temp_name.rename(pyproject_toml_path)
+            pyproject = cls(pyproject_toml_path)
         except FileNotFoundError as ex:
             errmsg = f'Unable to open "{pyproject_toml_path}" for saving - File not found.'
             raise FileNotFoundError(errmsg) from ex
+        for key_dot_notation in key_dot_notation_list:
+            pyproject.set_version(key_dot_notation, version)
+        for key_dot_notation in if_present_key_dot_notation_list or []:
+            pyproject.set_version(key_dot_notation, version, create=False)
+        pyproject.save()
+
+    @classmethod
+    def save_version(cls, pyproject_toml_path: Path, key_dot_notation_list: list[str], version: Version) -> None:
+        """
+        Save the version to each of the dotted keys in the given list to the pyproject.toml file.
+        """
+        cls.update_version(
+            pyproject_toml_path=pyproject_toml_path, version=version, key_dot_notation_list=key_dot_notation_list
+        )
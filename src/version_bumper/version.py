@@ -4,10 +4,11 @@
 
 from __future__ import annotations
 
+import copy
 import functools
 import re
-from collections.abc import Sequence
-from typing import Self
+from collections.abc import Callable, Sequence
+from typing import ClassVar, Self
 
 """
 A comparable Version object that fully conforms to the PYPA version specification in:
@@ -25,16 +26,34 @@ Usage example:
     version.bump_release()                  # 1.2.3
 """
 
-# functools.total_ordering
-# Given a class defining one or more rich comparison ordering methods, this class decorator supplies the rest.
-# This simplifies the effort involved in specifying all the possible rich comparison operations:
-#
-# The class must define one of __lt__(), __le__(), __gt__(), or __ge__(). In addition, the class should supply
-# an __eq__() method.
-
+# separator stripping and spelling substitutions for the normalizers: one C-level
+# translate pass (or one regex pass) instead of a chain of str.replace allocations.
+_SEP_STRIP = str.maketrans("", "", ".-_")
+_LOCAL_SEP_TRANS = str.maketrans("-_", "..")
+# longest-first alternation so "preview"/"pre" win over their prefixes; "rc" maps to
+# itself so the single substitution (count=1 below) stops at an already-normal token
+# instead of needing a start-anchored special case for "c".
+_PRE_SPELL_RE = re.compile(r"alpha|beta|preview|pre|rc|c")
+_PRE_SPELLINGS = {"alpha": "a", "beta": "b", "preview": "rc", "pre": "rc", "rc": "rc", "c": "rc"}
+_POST_SPELL_RE = re.compile(r"rev|r")
 
-@functools.total_ordering
 class Version:
+    # slots instead of a per-instance __dict__: smaller instances, faster attribute
+    # access, and typos on part names fail loudly instead of creating new attributes.
+    __slots__ = (
+        "version_str",
+        "epoch",
+        "release",
+        "major",
+        "minor",
+        "patch",
+        "pre",
+        "post",
+        "dev",
+        "local",
+        "_str_cache",
+    )
+
     # Constants
     PARTS: Sequence[str] = ("epoch", "major", "minor", "patch", "a", "b", "rc", "post", "dev", "local")
     PARSED_PARTS: Sequence[str] = ("epoch", "major", "minor", "patch", "pre", "post", "dev", "local")
@@ -42,39 +61,68 @@ class Version:
     POST_PARTS: Sequence[str] = ("r", "rev", "post")
     INT_PARTS: Sequence[str] = ("epoch", "major", "minor", "patch")
 
+    # frozenset views of the above for O(1) membership tests; the tuples remain
+    # for ordered uses (argparse choices, PARSED_PARTS index/slicing).
+    _PARTS_SET: frozenset[str] = frozenset(PARTS)
+    _PARSED_PARTS_SET: frozenset[str] = frozenset(PARSED_PARTS)
+    _PRE_PARTS_SET: frozenset[str] = frozenset(PRE_PARTS)
+    _POST_PARTS_SET: frozenset[str] = frozenset(POST_PARTS)
+
+    # part name -> the PARSED_PARTS tail to its right, so the clear-to-the-right
+    # paths are a dict lookup of a shared tuple instead of an index scan + slice
+    # allocation on every mutation.  Populated just after the class body because a
+    # comprehension in the class body cannot see class-level names.
+    _PARSED_PARTS_TAIL: ClassVar[dict[str, tuple[str, ...]]]
+
+    # part name (including the pre/post aliases) -> the parsed part that stores it;
+    # also populated after the class body.
+    _PART_TO_PARSED: ClassVar[dict[str, str]]
+
+    # the integer parts that __clear_parts zeroes (major is never cleared)
+    _CLEAR_TO_ZERO_SET: frozenset[str] = frozenset(("epoch", "minor", "patch"))
+
     # This version parsing regex is from:
     # https://packaging.python.org/en/latest/specifications/version-specifiers/#appendix-parsing-version-strings-with-regular-expressions
+    # with possessive quantifiers (++, *+, ?+; Python 3.11+, which this package already
+    # requires) added to the digit runs and separators.  No later branch can consume what
+    # these swallow, so dropping the backtracking states changes nothing but speed,
+    # especially the failure speed of almost-valid strings like "1.2.3.".
     VERSION_PATTERN = r"""
         v?
         (?:
-            (?:(?P<epoch>[0-9]+)!)?                           # epoch
-            (?P<release>[0-9]+(?:\.[0-9]+)*)                  # release segment
+            (?:(?P<epoch>[0-9]++)!)?                          # epoch
+            (?P<release>[0-9]++(?:\.[0-9]++)*+)               # release segment
             (?P<pre>                                          # pre-release
-                [-_\.]?
+                [-_\.]?+
                 (?P<pre_l>(a|b|c|rc|alpha|beta|pre|preview))
-                [-_\.]?
-                (?P<pre_n>[0-9]+)?
+                [-_\.]?                                       # not possessive: "1.0a-1"
+                (?P<pre_n>[0-9]++)?                           # hands the "-" to post's -N
+
             )?
             (?P<post>                                         # post release
-                (?:-(?P<post_n1>[0-9]+))
+                (?:-(?P<post_n1>[0-9]++))
                 |
                 (?:
-                    [-_\.]?
+                    [-_\.]?+
                     (?P<post_l>post|rev|r)
-                    [-_\.]?
-                    (?P<post_n2>[0-9]+)?
+                    [-_\.]?+
+                    (?P<post_n2>[0-9]++)?
                 )
             )?
             (?P<dev>                                          # dev release
-                [-_\.]?
+                [-_\.]?+
                 (?P<dev_l>dev)
-                [-_\.]?
-                (?P<dev_n>[0-9]+)?
+                [-_\.]?+
+                (?P<dev_n>[0-9]++)?
             )?
         )
-        (?:\+(?P<local>[a-z0-9]+(?:[-_\.][a-z0-9]+)*))?       # local version
+        (?:\+(?P<local>[a-z0-9]++(?:[-_\.][a-z0-9]++)*+))?    # local version
     """
 
+    # compiled once at class-load time.  Version is constructed on every load and every
+    # comparison-by-string, and a VERBOSE pattern this size is non-trivial to compile.
+    _VERSION_RE = re.compile(r"^\s*" + VERSION_PATTERN + r"\s*$", re.VERBOSE | re.IGNORECASE)
+
     def __init__(self, version_str: str) -> None:
         """
         Parse the version string into normalized parts in the Version instance.
@@ -95,76 +143,121 @@ class Version:
         # equivalent.
         self.version_str = version_str.lower().strip("\t\n\r\f\v").lstrip("v")
 
-        # parse the version string using the PYPA regex
-        _regex = re.compile(
-            r"^\s*" + Version.VERSION_PATTERN + r"\s*$",
-            re.VERBOSE | re.IGNORECASE,
-        )
-        match = _regex.match(self.version_str)
+        # fast path: a release-only version ("X", "X.Y", "X.Y.Z", optionally with an
+        # "N!" epoch) is the overwhelmingly common case in a bump workflow and needs a
+        # partition plus a few int conversions, not the verbose PYPA regex.
+        # isascii guards against non-ASCII "digits" that isdigit accepts but the PYPA grammar rejects
+        if self.version_str.isascii():
+            epoch_str, sep, release_str = self.version_str.partition("!")
+            if not sep:
+                epoch_str, release_str = "", self.version_str
+            fast_parts = release_str.split(".")
+            if (
+                len(fast_parts) <= 3
+                and (not sep or epoch_str.isdigit())
+                and all(part.isdigit() for part in fast_parts)
+            ):
+                num_parts = len(fast_parts)
+                self.epoch = int(epoch_str) if sep else 0
+                self.release = release_str
+                self.major = int(fast_parts[0])
+                self.minor = int(fast_parts[1]) if num_parts >= 2 else None
+                self.patch = int(fast_parts[2]) if num_parts >= 3 else None
+                self.pre = self.post = self.dev = self.local = ""
+                self._str_cache = None
+                return
+
+        # parse the version string using the precompiled PYPA regex
+        match = Version._VERSION_RE.match(self.version_str)
         if match is None:
             msg = f"Invalid version string: {self.version_str}"
             raise ValueError(msg)
 
-        # normalize the parts
-        self.epoch: int = int(match.group("epoch") or 0)
-        self.release: str = match.group("release")
-        release_parts: Sequence[int] = tuple(map(int, self.release.split(".")))
-        self.major: int = (
-            Version.__release_normalize(release_parts=release_parts, index=0, length=1, default_value=0) or 0
-        )
-        self.minor: int | None = Version.__release_normalize(
-            release_parts=release_parts, index=1, length=2, default_value=None
-        )
-        self.patch: int | None = Version.__release_normalize(
-            release_parts=release_parts, index=2, length=3, default_value=None
-        )
-        self.pre: str = Version.__pre_normalize(match.group("pre"))
-        self.post: str = Version.__post_normalize(match.group("post"))
-        self.dev: str = Version.__dev_normalize(match.group("dev"))
-        self.local: str = Version.__local_normalize(match.group("local"))
+        # normalize the parts, fetching all named groups in one call
+        groups = match.groupdict()
+        self.epoch: int = int(groups["epoch"] or 0)
+        self.release: str = groups["release"]
+        # only the first three release parts are used, so cap the split and convert
+        # each slot directly instead of materializing an int tuple first.
+        release_parts = self.release.split(".", 3)
+        num_parts = len(release_parts)
+        self.major: int = int(release_parts[0])
+        self.minor: int | None = int(release_parts[1]) if num_parts >= 2 else None
+        self.patch: int | None = int(release_parts[2]) if num_parts >= 3 else None
+        self.pre: str = Version.__pre_normalize(groups["pre"])
+        self.post: str = Version.__post_normalize(groups["post"])
+        self.dev: str = Version.__dev_normalize(groups["dev"])
+        self.local: str = Version.__local_normalize(groups["local"])
+
+        # memoized __str__, cleared by the mutating methods (bump, bump_release, set)
+        self._str_cache: str | None = None
+
+    @classmethod
+    def parse(cls, version_str: str) -> Version:
+        """
+        Parse with an LRU cache keyed on the version string, so repeat parses of the
+        same string (e.g. the project.version / tool.poetry.version sync check) skip
+        the regex match and normalization passes.  Returns a private copy, so callers
+        may mutate the result without poisoning the cache.
+        """
+        return copy.copy(_parse_cached(version_str))
 
     def __str__(self) -> str:
         """
         Convert from the version parts into a version string.
         """
-        version_parts = []
-        if int(self.epoch) > 0:
-            version_parts.append(f"{self.epoch}!")
-        version_parts.append(str(self.major))
-        if self.minor is not None:
-            version_parts.append(f".{self.minor}")
-        if self.patch is not None:
-            version_parts.append(f".{self.patch}")
-        version_parts.append(self.pre)
-        version_parts.append(self.post)
-        version_parts.append(self.dev)
-        if self.local:
-            version_parts.append(f"+{self.local}")
-        return "".join([str(v) for v in version_parts])
+        if self._str_cache is not None:
+            return self._str_cache
+        # assemble directly into one f-string instead of a part list plus join
+        epoch = f"{self.epoch}!" if self.epoch > 0 else ""
+        minor = f".{self.minor}" if self.minor is not None else ""
+        patch = f".{self.patch}" if self.patch is not None else ""
+        local = f"+{self.local}" if self.local else ""
+        self._str_cache = f"{epoch}{self.major}{minor}{patch}{self.pre}{self.post}{self.dev}{local}"
+        return self._str_cache
+
+    def _key(self) -> tuple[int, int, int, int, str, str, str, str]:
+        """
+        Comparison key.  An unused (None) minor or patch sorts before any integer value,
+        including 0, so map None to -1.  Not cached: parts may be assigned directly.
+        """
+        return (
+            self.epoch,
+            self.major,
+            self.minor if self.minor is not None else -1,
+            self.patch if self.patch is not None else -1,
+            self.pre,
+            self.post,
+            self.dev,
+            self.local,
+        )
 
     def __lt__(self, other: Self) -> bool:
         """test if self is less than other"""
+        # single C-level lexicographic tuple compare
+        return self._key() < other._key()
 
-        # note, testing order is critical
-        if self.epoch < other.epoch:
-            return True
-        if self.major < other.major:
-            return True
-        if Version.__is_optional_value_less_than(self.minor, other.minor):
-            return True
-        if Version.__is_optional_value_less_than(self.patch, other.patch):
-            return True
-        if self.pre < other.pre:
-            return True
-        if self.post < other.post:
-            return True
-        if self.dev < other.dev:
-            return True
-        return self.local < other.local
+    # the remaining orderings are spelled out (instead of functools.total_ordering)
+    # so each is one tuple compare rather than a synthesized __lt__-plus-__eq__ pair.
+    def __le__(self, other: Self) -> bool:
+        """test if self is less than or equal to other"""
+        return self._key() <= other._key()
+
+    def __gt__(self, other: Self) -> bool:
+        """test if self is greater than other"""
+        return self._key() > other._key()
+
+    def __ge__(self, other: Self) -> bool:
+        """test if self is greater than or equal to other"""
+        return self._key() >= other._key()
 
     def __eq__(self, other: object) -> bool:
         """test if self is equal to other"""
-        return str(self) == str(other)
+        if self is other:
+            return True
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self._key() == other._key()
 
     def bump(self, part: str) -> Self:
         """Increment the given part of the version.
@@ -173,28 +266,19 @@ class Version:
         Set the value to new_version if it is not None.
         return the Version instance.
         """
-        if part not in Version.PARTS:
+        if part not in Version._PARTS_SET:
             msg = f"Invalid part value: {part}"
             raise ValueError(msg)
 
-        self.epoch = Version.__bump_int_part(part=part, prefix="epoch", value=self.epoch) or 0
-        self.major = Version.__bump_int_part(part=part, prefix="major", value=self.major) or 0
-        self.minor = Version.__bump_int_part(part=part, prefix="minor", value=self.minor)
-        if part == "patch":
-            self.minor = int(self.minor or 0)
-        self.patch = Version.__bump_int_part(part=part, prefix="patch", value=self.patch)
-        self.pre = Version.__bump_part(part=part, prefix="a", value=self.pre)
-        self.pre = Version.__bump_part(part=part, prefix="b", value=self.pre)
-        self.pre = Version.__bump_part(part=part, prefix="rc", value=self.pre)
-        self.post = Version.__bump_part(part=part, prefix=".post", value=self.post)
-        self.dev = Version.__bump_part(part=part, prefix=".dev", value=self.dev)
-        self.local = Version.__bump_local(part=part, value=self.local)
+        # dispatch straight to the requested part's helper instead of running every
+        # part's helper and letting all but one fall through.
+        Version._BUMP_DISPATCH[part](self)
 
         # clear parts to the right of the bumped part, except epoch
         if part != "epoch":
-            part_index = Version.PARSED_PARTS.index(Version.__part_to_parsed_part(part))
-            self.__clear_parts(Version.PARSED_PARTS[part_index + 1 :])
+            self.__clear_parts(Version._PARSED_PARTS_TAIL[Version._PART_TO_PARSED[part]])
 
+        self._str_cache = None
         return self
 
     def bump_release(self) -> Self:
@@ -203,6 +287,7 @@ class Version:
         returns the Version instance.
         """
         self.__clear_parts(["pre", "post", "dev", "local"])
+        self._str_cache = None
         return self
 
     def set(self, part: str, value: str, clear_right: bool = False) -> Self:
@@ -210,12 +295,12 @@ class Version:
         Normalize the value then replace the part's value with it.
         returns the Version instance.
         """
-        if part in Version.PARTS:
-            if part in Version.PRE_PARTS:
+        if part in Version._PARTS_SET:
+            if part in Version._PRE_PARTS_SET:
                 value = f"{part}{value}"
                 part = "pre"
                 setattr(self, part, Version.__pre_normalize(value))
-            elif part in Version.POST_PARTS:
+            elif part in Version._POST_PARTS_SET:
                 part = "post"
                 setattr(self, part, Version.__post_normalize(value))
             elif part == "local":
@@ -225,8 +310,8 @@ class Version:
             else:  # all that's left are the integer parts: epoch, major, minor, and patch
                 setattr(self, part, int(value))
             if clear_right:
-                parts_to_clear_slice = slice(Version.PARSED_PARTS.index(part) + 1, None)
-                self.__clear_parts(Version.PARSED_PARTS[parts_to_clear_slice])
+                self.__clear_parts(Version._PARSED_PARTS_TAIL[part])
+            self._str_cache = None
         return self
 
     # The following static methods are just basically functions scoped within the class
@@ -234,18 +319,6 @@ class Version:
     # Also, I use the convention of Classname.__methodname instead of the allowable
     # self.__methodname to visually indicate a static method.
 
-    @staticmethod
-    def __part_to_parsed_part(part: str) -> str:
-        """
-        The pre and post parts have aliases (a, b, rc, alpha,...).  If the given part is an
-        alias, replace it with the base part (pre or post).
-        """
-        if part in Version.PRE_PARTS:
-            part = "pre"
-        elif part in Version.POST_PARTS:
-            part = "post"
-        return part
-
     @staticmethod
     def __implicit_release(release: str) -> str:
         """
@@ -254,14 +327,15 @@ class Version:
         form for this is to include the 0 explicitly. This allows versions such as 1.2a which is normalized
         to 1.2a0.
         """
-        match = re.match(r"(.*\D)(\d+)$", release)
-        if match:
-            prefix = match.group(1)
-            value = int(match.group(2))
-            release = f"{prefix}{value}"
-        else:
-            release = f"{release}0"
-        return release
+        # trailing-digit scan instead of a regex; the callers always pass a
+        # prefixed string (aN/bN/rcN/postN/devN), so the prefix end is the first
+        # non-digit from the right.
+        index = len(release)
+        while index > 0 and release[index - 1].isdigit():
+            index -= 1
+        if index in (0, len(release)):
+            return f"{release}0"
+        return f"{release[:index]}{int(release[index:])}"
 
     @staticmethod
     def __prefix_normalize(release: str, prefix: str) -> str:
@@ -269,19 +343,10 @@ class Version:
         Prefix (pre, post, and dev) parts need to be of the form "{prefix}N".
         When release is N, make it "{prefix}N".
         """
-        if all(characters.isdigit() for characters in release):
+        if release.isdigit():
             release = f"{prefix}{release}"
         return release
 
-    @staticmethod
-    def __release_normalize(
-        release_parts: Sequence[int], index: int, length: int, default_value: int | None
-    ) -> int | None:
-        """
-        Release (major, minor, patch) parts are integers with the minor and patch parts being optional.
-        """
-        return release_parts[index] if len(release_parts) >= length else default_value
-
     @staticmethod
     def __pre_normalize(release: str) -> str:
         """
@@ -304,14 +369,8 @@ class Version:
         """
         release = release or ""
         if release:
-            release = release.replace(".", "")
-            release = release.replace("-", "")
-            release = release.replace("_", "")
-            release = release.replace("alpha", "a")
-            release = release.replace("beta", "b")
-            release = release.replace("c", "rc") if release.startswith("c") else release
-            release = release.replace("preview", "rc")
-            release = release.replace("pre", "rc")
+            release = release.translate(_SEP_STRIP)
+            release = _PRE_SPELL_RE.sub(lambda match: _PRE_SPELLINGS[match.group()], release, count=1)
             release = Version.__prefix_normalize(release=release, prefix="pre")
             release = Version.__implicit_release(release)
         return release
@@ -338,13 +397,8 @@ class Version:
         """
         release = release or ""
         if release:
-            if re.match(r"^[.\-_]", release):
-                release = release[1:]
-            release = release.replace(".", "")
-            release = release.replace("-", "")
-            release = release.replace("_", "")
-            release = release.replace("rev", "post")
-            release = release.replace("r", "post")
+            release = release.translate(_SEP_STRIP)
+            release = _POST_SPELL_RE.sub("post", release)
             release = Version.__prefix_normalize(release=release, prefix="post")
             release = Version.__implicit_release(release)
             release = f".{release}"
@@ -365,11 +419,7 @@ class Version:
         """
         release = release or ""
         if release:
-            if re.match(r"^[.\-_]", release):
-                release = release[1:]
-            release = release.replace(".", "")
-            release = release.replace("-", "")
-            release = release.replace("_", "")
+            release = release.translate(_SEP_STRIP)
             release = Version.__prefix_normalize(release=release, prefix="dev")
             release = Version.__implicit_release(release)
             release = f".{release}"
@@ -383,61 +433,70 @@ class Version:
         also acceptable. The normal form is using the . character. This allows versions such as
         1.0+ubuntu-1 to be normalized to 1.0+ubuntu.1.
         """
-        release = release or ""
-        if release:
-            release = release.replace("-", ".")
-            release = release.replace("_", ".")
-        return release
+        return (release or "").translate(_LOCAL_SEP_TRANS)
 
     @staticmethod
-    def __is_optional_value_less_than(value1: int | None, value2: int | None) -> bool:
-        """
-        Integer compare for less than where any value may be None.
-        None is considered less than any integer, but equal to an empty string.
-        Both values None are considered not less than.
-        case  value1  ?  value2  < returns
-         a     None  ==   None    False
-         b     None  <    int     True
-         c     int   >    None    False
-         d     int   ?    int     value1 < value2
-        """
-        if value1 is None and value2 is not None:  # case b
-            return True
-        if value1 is not None and value2 is not None:  # case d
-            return value1 < value2
-        return False  # case a, c
-
-    @staticmethod
-    def __bump_part(part: str, prefix: str, value: str) -> str:
+    def __bump_prefixed(prefix: str, value: str) -> str:
         """
         Increment the part version for prefixed parts (ex: "dev" -> "dev0", ".devN" -> ".devN+1").
-        For parts without a numerical value, set the numeric value to "0" (ex: "dev" -> "dev0")
+        For parts without a numerical value, set the numeric value to "1" (ex: "" -> ".dev1")
         """
-        if part and prefix and (prefix in {part, f".{part}"}):
-            if value.startswith(prefix):
-                return f"{prefix}{int(value[len(prefix):]) + 1}"
-            return f"{prefix}1"
-        return value
+        if value.startswith(prefix):
+            return f"{prefix}{int(value[len(prefix):]) + 1}"
+        return f"{prefix}1"
 
-    @staticmethod
-    def __bump_int_part(part: str, prefix: str, value: int | None) -> int | None:
-        """
-        Increment integer parts.
-        """
-        if part and prefix and part == prefix:
-            value = (value or 0) + 1
-        return value
+    def __bump_epoch(self) -> None:
+        self.epoch += 1
 
-    @staticmethod
-    def __bump_local(part: str, value: str) -> str:
+    def __bump_major(self) -> None:
+        self.major += 1
+
+    def __bump_minor(self) -> None:
+        self.minor = (self.minor or 0) + 1
+
+    def __bump_patch(self) -> None:
+        # bumping patch makes an implicit minor of 0 explicit
+        self.minor = int(self.minor or 0)
+        self.patch = (self.patch or 0) + 1
+
+    def __bump_pre(self, prefix: str) -> None:
+        self.pre = Version.__bump_prefixed(prefix=prefix, value=self.pre)
+
+    def __bump_post(self) -> None:
+        self.post = Version.__bump_prefixed(prefix=".post", value=self.post)
+
+    def __bump_dev(self) -> None:
+        self.dev = Version.__bump_prefixed(prefix=".dev", value=self.dev)
+
+    def __bump_local(self) -> None:
         """
         Increment trailing integer of the local part.
         If the local part does not have a trailing integer, set it to "1".
         """
-        if part == "local":
-            match = re.match(r"(.*)(\d+)$", value)
-            value = f"{value}1" if match is None else f"{match.group(1)}{int(match.group(2)) + 1}"
-        return value
+        value = self.local
+        index = len(value)
+        while index > 0 and value[index - 1].isdigit():
+            index -= 1
+        if index == len(value):
+            self.local = f"{value}1"
+        else:
+            # increment the whole trailing integer, keeping any zero padding (foo0123 -> foo0124)
+            tail = value[index:]
+            self.local = f"{value[:index]}{int(tail) + 1:0{len(tail)}d}"
+
+    # bump() dispatch table: part name -> the one helper that mutates that part.
+    _BUMP_DISPATCH: ClassVar[dict[str, Callable[[Version], None]]] = {
+        "epoch": __bump_epoch,
+        "major": __bump_major,
+        "minor": __bump_minor,
+        "patch": __bump_patch,
+        "a": functools.partial(__bump_pre, prefix="a"),
+        "b": functools.partial(__bump_pre, prefix="b"),
+        "rc": functools.partial(__bump_pre, prefix="rc"),
+        "post": __bump_post,
+        "dev": __bump_dev,
+        "local": __bump_local,
+    }
 
     def __clear_parts(self, parts: Sequence[str]) -> None:
         """
@@ -446,11 +505,35 @@ class Version:
         Do not clear "major" part.
         The clear value is "0" for integer parts and "" for non-integer parts.
         """
+        # C-level set containment; the callers pass slices of PARSED_PARTS so
+        # contiguity does not need to be checked, just membership.
+        if not Version._PARSED_PARTS_SET.issuperset(parts):
+            errmsg = f"Invalid version parts: {parts}"
+            raise ValueError(errmsg)
         for part in parts:
             # do not clear major
-            if part in ["epoch", "minor", "patch"]:
+            if part in Version._CLEAR_TO_ZERO_SET:
                 # do not clear if part is unused in the version
                 if isinstance(getattr(self, part), int):
                     setattr(self, part, 0)
             elif part != "major":
                 setattr(self, part, "")
+
+
+Version._PARSED_PARTS_TAIL = {
+    part: tuple(Version.PARSED_PARTS[index + 1 :]) for index, part in enumerate(Version.PARSED_PARTS)
+}
+
+# The pre and post parts have aliases (a, b, rc, alpha,...); map every part name
+# to the parsed part that stores it so bump() resolves aliases with one lookup.
+Version._PART_TO_PARSED = {
+    **{part: part for part in Version.PARSED_PARTS},
+    **{part: "pre" for part in Version.PRE_PARTS},
+    **{part: "post" for part in Version.POST_PARTS},
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_cached(version_str: str) -> Version:
+    """Shared prototype instances behind Version.parse; never hand these out directly."""
+    return Version(version_str)
@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2024 Roy Wright
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+import pytest
+
+tests_dir = Path(__file__).parent
+good_pyproject_toml_path = tests_dir / "good_pyproject.toml"
+
+STARTING_VERSION_STR = "0.1.1a2.post1.dev2+foo0123"
+
+# project.version and tool.poetry.version both sit at the start of their lines; the
+# dependency tables only use "version =" inside inline tables, so ^ keeps them untouched.
+_VERSION_LINE_RE = re.compile(rb'^version\s*=\s*"[^"]*"', re.MULTILINE)
+
+
+@pytest.fixture(scope="session")
+def good_pyproject_bytes() -> bytes:
+    """The raw good_pyproject.toml bytes, read from disk once per session."""
+    return good_pyproject_toml_path.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def pyproject_template_bytes() -> bytes:
+    """
+    good_pyproject.toml with STARTING_VERSION_STR stamped into both version keys,
+    read and built once per session.
+    """
+    return _VERSION_LINE_RE.sub(
+        b'version = "' + STARTING_VERSION_STR.encode() + b'"', good_pyproject_toml_path.read_bytes()
+    )
+
+
+@pytest.fixture(scope="session")
+def _pyproject_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One temp file per session (per xdist worker); tests overwrite it in place."""
+    return tmp_path_factory.mktemp("pyproject") / "pyproject.toml"
+
+
+@pytest.fixture
+def pyproject_file(_pyproject_path: Path, pyproject_template_bytes: bytes) -> str:
+    """
+    Path to a per-test pyproject.toml with a known starting version.  Tests within a
+    worker run sequentially, so rewriting the one shared file keeps them isolated
+    without creating and unlinking a temp file per test.
+    """
+    _pyproject_path.write_bytes(pyproject_template_bytes)
+    return str(_pyproject_path)
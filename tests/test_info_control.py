@@ -6,26 +6,37 @@
 
 from __future__ import annotations
 
+import pytest
+
 from version_bumper.clibones.info_control import InfoControl
 
 
-def test_version() -> None:
-    info_control = InfoControl(app_package="version_bumper")
+@pytest.fixture(scope="module")
+def info_control() -> InfoControl:
+    """One InfoControl per module; building it triggers importlib.metadata lookups."""
+    return InfoControl(app_package="version_bumper")
+
+
+@pytest.fixture(scope="module")
+def default_info_control() -> InfoControl:
+    """InfoControl for a package without metadata, shared across the module's tests."""
+    return InfoControl(app_package=".")
+
+
+def test_version(info_control: InfoControl) -> None:
     version: str = info_control._load_version()
     assert isinstance(version, str)
     assert len(version) > 0
 
 
-def test_default_version() -> None:
-    info_control = InfoControl(app_package=".")
-    version: str = info_control._load_version()
+def test_default_version(default_info_control: InfoControl) -> None:
+    version: str = default_info_control._load_version()
     assert isinstance(version, str)
     assert len(version) > 0
     assert version == InfoControl.DEFAULT_VERSION
 
 
-def test_longhelp() -> None:
-    info_control = InfoControl(app_package="version_bumper")
+def test_longhelp(info_control: InfoControl) -> None:
     longhelp: str = info_control._load_longhelp()
     assert longhelp is not None
     assert isinstance(longhelp, str)
@@ -33,9 +44,8 @@ def test_longhelp() -> None:
     assert not longhelp.startswith("Long Help not available.")
 
 
-def test_default_longhelp() -> None:
-    info_control = InfoControl(app_package=".")
-    longhelp: str = info_control._load_longhelp()
+def test_default_longhelp(default_info_control: InfoControl) -> None:
+    longhelp: str = default_info_control._load_longhelp()
     assert longhelp is not None
     assert isinstance(longhelp, str)
     assert len(longhelp) > 0
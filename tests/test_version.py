@@ -9,62 +9,78 @@ import pytest
 from version_bumper.version import Version
 
 
-def test_version_roundtrip() -> None:
+@pytest.mark.parametrize(
+    "version_str",
+    [
+        pytest.param("1", id="release N"),
+        pytest.param("0.1", id="release N.N"),
+        pytest.param("0.1.0", id="release N.N.N"),
+        pytest.param("2!0.1.0", id="epoch N!N.N.N"),
+        pytest.param("0.1.0a1", id="pre N.N.NaN"),
+        pytest.param("0.1.0b1", id="pre N.N.NbN"),
+        pytest.param("0.1.0rc1", id="pre N.N.NrcN"),
+        pytest.param("0.1.0.post2", id="post N.N.N.postN"),
+        pytest.param("0.1.0a3.post2", id="pre post N.N.NaN.postN"),
+        pytest.param("0.1.0b13.post2", id="pre post N.N.NbN.postN"),
+        pytest.param("0.1.0rc123.post2", id="pre post N.N.NrcN.postN"),
+        pytest.param("0.1.0.dev3", id="dev N.N.N.devN"),
+        pytest.param("0.1.0.dev3+41", id="dev local N.N.N.devN+N"),
+        pytest.param("1!0.1.0rc123.post2.dev4+41ax", id="epoch release pre post dev local"),
+    ],
+)
+def test_version_roundtrip(version_str: str) -> None:
     """string to Version to string"""
-    assert str(Version("1")) == "1", "release N"
-    assert str(Version("0.1")) == "0.1", "release N.N"
-    assert str(Version("0.1.0")) == "0.1.0", "release N.N.N"
-    assert str(Version("2!0.1.0")) == "2!0.1.0", "epoch N!N.N.N"
-    assert str(Version("0.1.0a1")) == "0.1.0a1", "pre N.N.NaN"
-    assert str(Version("0.1.0b1")) == "0.1.0b1", "pre N.N.NaN"
-    assert str(Version("0.1.0rc1")) == "0.1.0rc1", "pre N.N.NaN"
-    assert str(Version("0.1.0.post2")) == "0.1.0.post2", "post N.N.N.postN"
-    assert str(Version("0.1.0a3.post2")) == "0.1.0a3.post2", "pre post N.N.N{a|b|rc}N.postN"
-    assert str(Version("0.1.0b13.post2")) == "0.1.0b13.post2", "pre post N.N.N{a|b|rc}N.postN"
-    assert str(Version("0.1.0rc123.post2")) == "0.1.0rc123.post2", "pre post N.N.N{a|b|rc}N.postN"
-    assert str(Version("0.1.0.dev3")) == "0.1.0.dev3", "dev N.N.N.devN"
-    assert str(Version("0.1.0.dev3+41")) == "0.1.0.dev3+41", "dev local N.N.N.devN+N"
-    assert (
-        str(Version("1!0.1.0rc123.post2.dev4+41ax")) == "1!0.1.0rc123.post2.dev4+41ax"
-    ), "epoch release pre post dev local N!N.N.N{a|b|rc}N.postN.devN+local"
-
-
-def test_less_than() -> None:
-    assert Version("1") < Version("2")
-    assert Version("0.1") < Version("0.1.1")
-    assert Version("0.1.1") < Version("0.1.11")
-    assert Version("0.1.0") < Version("1!0.1.0")
-    assert Version("2!0.1.0") < Version("2!0.1.1")
-    assert Version("2!0.1.0") < Version("3!0.1.0")
-    assert Version("0.1.0a1") < Version("0.1.0a2")
-    assert Version("0.1.0a1") < Version("0.1.0b1")
-    assert Version("0.1.0rc1") < Version("0.1.1rc1")
-    assert Version("0.1.0.post2") < Version("0.1.0.post3")
-    assert Version("0.1.0a3.post2") < Version("0.1.0a4.post2")
-    assert Version("0.1.0b13.post2") < Version("0.1.0b13.post4")
-    assert Version("0.1.0rc123.post2") < Version("0.1.1rc123.post2")
-    assert Version("0.1.0rc123.post2") < Version("0.2.0rc123.post2")
-    assert Version("0.1.0rc123.post2") < Version("1.1.0rc123.post2")
-    assert Version("0.1.0.dev3") < Version("0.1.1.dev3")
-    assert Version("0.1.0.dev3") < Version("0.1.0.dev4")
-    assert Version("0.1.0.dev3+40") < Version("0.1.0.dev3+41")
-    assert Version("1!0.1.0rc123.post2.dev4+41ax") < Version("1!0.1.0rc123.post2.dev4+41bx")
-
-
-def test_equal() -> None:
-    assert Version("1") == Version("1")
-    assert Version("0.1") == Version("0.1")
-    assert Version("0.1.1") == Version("0.1.1")
-    assert Version("2!0.1.0") == Version("2!0.1.0")
-    assert Version("0.1.0a1") == Version("0.1.0a1")
-    assert Version("0.1.0b1") == Version("0.1.0b1")
-    assert Version("0.1.0rc1") == Version("0.1.0rc1")
-    assert Version("0.1.0.post2") == Version("0.1.0.post2")
-    assert Version("0.1.0a3.post2") == Version("0.1.0a3.post2")
-    assert Version("0.1.0rc123.post2") == Version("0.1.0rc123.post2")
-    assert Version("0.1.0.dev3") == Version("0.1.0.dev3")
-    assert Version("0.1.0.dev3+41") == Version("0.1.0.dev3+41")
-    assert Version("1!0.1.0rc123.post2.dev4+41ax") == Version("1!0.1.0rc123.post2.dev4+41ax")
+    assert str(Version(version_str)) == version_str
+
+
+@pytest.mark.parametrize(
+    ("smaller", "larger"),
+    [
+        ("1", "2"),
+        ("0.1", "0.1.1"),
+        ("0.1.1", "0.1.11"),
+        ("0.1.0", "1!0.1.0"),
+        ("2!0.1.0", "2!0.1.1"),
+        ("2!0.1.0", "3!0.1.0"),
+        ("0.1.0a1", "0.1.0a2"),
+        ("0.1.0a1", "0.1.0b1"),
+        ("0.1.0rc1", "0.1.1rc1"),
+        ("0.1.0.post2", "0.1.0.post3"),
+        ("0.1.0a3.post2", "0.1.0a4.post2"),
+        ("0.1.0b13.post2", "0.1.0b13.post4"),
+        ("0.1.0rc123.post2", "0.1.1rc123.post2"),
+        ("0.1.0rc123.post2", "0.2.0rc123.post2"),
+        ("0.1.0rc123.post2", "1.1.0rc123.post2"),
+        ("0.1.0.dev3", "0.1.1.dev3"),
+        ("0.1.0.dev3", "0.1.0.dev4"),
+        ("0.1.0.dev3+40", "0.1.0.dev3+41"),
+        ("1!0.1.0rc123.post2.dev4+41ax", "1!0.1.0rc123.post2.dev4+41bx"),
+    ],
+)
+def test_less_than(smaller: str, larger: str) -> None:
+    assert Version(smaller) < Version(larger)
+
+
+@pytest.mark.parametrize(
+    "version_str",
+    [
+        "1",
+        "0.1",
+        "0.1.1",
+        "2!0.1.0",
+        "0.1.0a1",
+        "0.1.0b1",
+        "0.1.0rc1",
+        "0.1.0.post2",
+        "0.1.0a3.post2",
+        "0.1.0rc123.post2",
+        "0.1.0.dev3",
+        "0.1.0.dev3+41",
+        "1!0.1.0rc123.post2.dev4+41ax",
+    ],
+)
+def test_equal(version_str: str) -> None:
+    assert Version(version_str) == Version(version_str)
 
 
 def test_bump() -> None:
@@ -112,95 +128,137 @@ def test_set() -> None:
     assert str(Version("1.2").set(part="rc", value="")) == "1.2rc0"
 
 
-def test_normalizations() -> None:
-    assert str(Version("1.2.3")) == "1.2.3"
-    assert str(Version("1.2.3.a")) == "1.2.3a0"
-    assert str(Version("1.2.3.a1")) == "1.2.3a1"
-    assert str(Version("1.2.3.a01")) == "1.2.3a1"
-    assert str(Version("1.2.3alpha1")) == "1.2.3a1"
-    assert str(Version("1.2.3beta1")) == "1.2.3b1"
-    assert str(Version("1.2.3c1")) == "1.2.3rc1"
-    assert str(Version("1.2.3pre1")) == "1.2.3rc1"
-    assert str(Version("1.2.3preview1")) == "1.2.3rc1"
-    assert str(Version("1.2.3preview")) == "1.2.3rc0"
-    assert str(Version("1.2.3.A")) == "1.2.3a0"
-    assert str(Version("1.2.3.A1")) == "1.2.3a1"
-    assert str(Version("1.2.3.A01")) == "1.2.3a1"
-    assert str(Version("1.2.3Alpha1")) == "1.2.3a1"
-    assert str(Version("1.2.3BETA1")) == "1.2.3b1"
-    assert str(Version("1.2.3C1")) == "1.2.3rc1"
-    assert str(Version("1.2.3PRE1")) == "1.2.3rc1"
-    assert str(Version("1.2.3Preview1")) == "1.2.3rc1"
-    assert str(Version("1.2.3PREVIEW")) == "1.2.3rc0"
-
-
-def test_prerelease_separators() -> None:
-    assert str(Version("1.1a")) == "1.1a0"
-    assert str(Version("1.1.a")) == "1.1a0"
-    assert str(Version("1.1-a")) == "1.1a0"
-    assert str(Version("1.1_a")) == "1.1a0"
-    assert str(Version("1.1a.2")) == "1.1a2"
-    assert str(Version("1.1a-2")) == "1.1a2"
-    assert str(Version("1.1a_2")) == "1.1a2"
-
-
-def test_postrelease_separators() -> None:
-    assert str(Version("1.2.3.post1")) == "1.2.3.post1"
-    assert str(Version("1.2.3.post.1")) == "1.2.3.post1"
-    assert str(Version("1.2.3.post-1")) == "1.2.3.post1"
-    assert str(Version("1.2.3.post_1")) == "1.2.3.post1"
-    assert str(Version("1.2.3-post1")) == "1.2.3.post1"
-    assert str(Version("1.2.3-post.1")) == "1.2.3.post1"
-    assert str(Version("1.2.3-post-1")) == "1.2.3.post1"
-    assert str(Version("1.2.3-post_1")) == "1.2.3.post1"
-    assert str(Version("1.2.3_post1")) == "1.2.3.post1"
-    assert str(Version("1.2.3_post.1")) == "1.2.3.post1"
-    assert str(Version("1.2.3_post-1")) == "1.2.3.post1"
-    assert str(Version("1.2.3_post_1")) == "1.2.3.post1"
-    assert str(Version("1.2.3.post")) == "1.2.3.post0"
-    assert str(Version("1.2.3-post")) == "1.2.3.post0"
-    assert str(Version("1.2.3_post")) == "1.2.3.post0"
-    assert str(Version("1.2.3-1")) == "1.2.3.post1"
-
-
-def test_dev_separators() -> None:
-    assert str(Version("1.2.3.dev1")) == "1.2.3.dev1"
-    assert str(Version("1.2.3-dev1")) == "1.2.3.dev1"
-    assert str(Version("1.2.3_dev1")) == "1.2.3.dev1"
-    assert str(Version("1.2.3dev1")) == "1.2.3.dev1"
-    assert str(Version("1.2.3.dev.1")) == "1.2.3.dev1"
-    assert str(Version("1.2.3-dev-1")) == "1.2.3.dev1"
-    assert str(Version("1.2.3_dev_1")) == "1.2.3.dev1"
-    assert str(Version("1.2.3dev")) == "1.2.3.dev0"
-
-
-def test_whitespaces() -> None:
-    assert str(Version(" 1.2.3")) == "1.2.3"
-    assert str(Version("\t1.2.3.a")) == "1.2.3a0"
-    assert str(Version("\n1.2.3.a1")) == "1.2.3a1"
-    assert str(Version("\r1.2.3.a01")) == "1.2.3a1"
-    assert str(Version("\f1.2.3alpha1")) == "1.2.3a1"
-    assert str(Version("\v1.2.3beta1")) == "1.2.3b1"
-    assert str(Version("1.2.3c1 ")) == "1.2.3rc1"
-    assert str(Version("1.2.3pre1\t")) == "1.2.3rc1"
-    assert str(Version("1.2.3preview1\n")) == "1.2.3rc1"
-    assert str(Version("1.2.3preview\r")) == "1.2.3rc0"
-    assert str(Version("1.2.3preview1\f")) == "1.2.3rc1"
-    assert str(Version("1.2.3preview1\v")) == "1.2.3rc1"
-    assert str(Version(" \t\n\r\f\v1.2.3preview1 \t\n\r\f\v")) == "1.2.3rc1"
-
-
-def test_v_prefix() -> None:
-    assert str(Version("v1.2.3.dev1")) == "1.2.3.dev1"
-    assert str(Version("V1.1")) == "1.1"
-
-
-def test_local() -> None:
-    assert str(Version("v1.2.3+foo")) == "1.2.3+foo"
-    assert str(Version("v1.2.3+foo0100")) == "1.2.3+foo0100"
-    assert str(Version("v1.2.3+ubuntu.1")) == "1.2.3+ubuntu.1"
-    assert str(Version("v1.2.3+ubuntu-1")) == "1.2.3+ubuntu.1"
-    assert str(Version("v1.2.3+ubuntu_1")) == "1.2.3+ubuntu.1"
+@pytest.mark.parametrize(
+    ("version_str", "expected"),
+    [
+        ("1.2.3", "1.2.3"),
+        ("1.2.3.a", "1.2.3a0"),
+        ("1.2.3.a1", "1.2.3a1"),
+        ("1.2.3.a01", "1.2.3a1"),
+        ("1.2.3alpha1", "1.2.3a1"),
+        ("1.2.3beta1", "1.2.3b1"),
+        ("1.2.3c1", "1.2.3rc1"),
+        ("1.2.3pre1", "1.2.3rc1"),
+        ("1.2.3preview1", "1.2.3rc1"),
+        ("1.2.3preview", "1.2.3rc0"),
+        ("1.2.3.A", "1.2.3a0"),
+        ("1.2.3.A1", "1.2.3a1"),
+        ("1.2.3.A01", "1.2.3a1"),
+        ("1.2.3Alpha1", "1.2.3a1"),
+        ("1.2.3BETA1", "1.2.3b1"),
+        ("1.2.3C1", "1.2.3rc1"),
+        ("1.2.3PRE1", "1.2.3rc1"),
+        ("1.2.3Preview1", "1.2.3rc1"),
+        ("1.2.3PREVIEW", "1.2.3rc0"),
+    ],
+)
+def test_normalizations(version_str: str, expected: str) -> None:
+    assert str(Version(version_str)) == expected
+
+
+@pytest.mark.parametrize(
+    ("version_str", "expected"),
+    [
+        ("1.1a", "1.1a0"),
+        ("1.1.a", "1.1a0"),
+        ("1.1-a", "1.1a0"),
+        ("1.1_a", "1.1a0"),
+        ("1.1a.2", "1.1a2"),
+        ("1.1a-2", "1.1a2"),
+        ("1.1a_2", "1.1a2"),
+    ],
+)
+def test_prerelease_separators(version_str: str, expected: str) -> None:
+    assert str(Version(version_str)) == expected
+
+
+@pytest.mark.parametrize(
+    ("version_str", "expected"),
+    [
+        ("1.2.3.post1", "1.2.3.post1"),
+        ("1.2.3.post.1", "1.2.3.post1"),
+        ("1.2.3.post-1", "1.2.3.post1"),
+        ("1.2.3.post_1", "1.2.3.post1"),
+        ("1.2.3-post1", "1.2.3.post1"),
+        ("1.2.3-post.1", "1.2.3.post1"),
+        ("1.2.3-post-1", "1.2.3.post1"),
+        ("1.2.3-post_1", "1.2.3.post1"),
+        ("1.2.3_post1", "1.2.3.post1"),
+        ("1.2.3_post.1", "1.2.3.post1"),
+        ("1.2.3_post-1", "1.2.3.post1"),
+        ("1.2.3_post_1", "1.2.3.post1"),
+        ("1.2.3.post", "1.2.3.post0"),
+        ("1.2.3-post", "1.2.3.post0"),
+        ("1.2.3_post", "1.2.3.post0"),
+        ("1.2.3-1", "1.2.3.post1"),
+    ],
+)
+def test_postrelease_separators(version_str: str, expected: str) -> None:
+    assert str(Version(version_str)) == expected
+
+
+@pytest.mark.parametrize(
+    ("version_str", "expected"),
+    [
+        ("1.2.3.dev1", "1.2.3.dev1"),
+        ("1.2.3-dev1", "1.2.3.dev1"),
+        ("1.2.3_dev1", "1.2.3.dev1"),
+        ("1.2.3dev1", "1.2.3.dev1"),
+        ("1.2.3.dev.1", "1.2.3.dev1"),
+        ("1.2.3-dev-1", "1.2.3.dev1"),
+        ("1.2.3_dev_1", "1.2.3.dev1"),
+        ("1.2.3dev", "1.2.3.dev0"),
+    ],
+)
+def test_dev_separators(version_str: str, expected: str) -> None:
+    assert str(Version(version_str)) == expected
+
+
+@pytest.mark.parametrize(
+    ("version_str", "expected"),
+    [
+        (" 1.2.3", "1.2.3"),
+        ("\t1.2.3.a", "1.2.3a0"),
+        ("\n1.2.3.a1", "1.2.3a1"),
+        ("\r1.2.3.a01", "1.2.3a1"),
+        ("\f1.2.3alpha1", "1.2.3a1"),
+        ("\v1.2.3beta1", "1.2.3b1"),
+        ("1.2.3c1 ", "1.2.3rc1"),
+        ("1.2.3pre1\t", "1.2.3rc1"),
+        ("1.2.3preview1\n", "1.2.3rc1"),
+        ("1.2.3preview\r", "1.2.3rc0"),
+        ("1.2.3preview1\f", "1.2.3rc1"),
+        ("1.2.3preview1\v", "1.2.3rc1"),
+        (" \t\n\r\f\v1.2.3preview1 \t\n\r\f\v", "1.2.3rc1"),
+    ],
+)
+def test_whitespaces(version_str: str, expected: str) -> None:
+    assert str(Version(version_str)) == expected
+
+
+@pytest.mark.parametrize(
+    ("version_str", "expected"),
+    [
+        ("v1.2.3.dev1", "1.2.3.dev1"),
+        ("V1.1", "1.1"),
+    ],
+)
+def test_v_prefix(version_str: str, expected: str) -> None:
+    assert str(Version(version_str)) == expected
+
+
+@pytest.mark.parametrize(
+    ("version_str", "expected"),
+    [
+        ("v1.2.3+foo", "1.2.3+foo"),
+        ("v1.2.3+foo0100", "1.2.3+foo0100"),
+        ("v1.2.3+ubuntu.1", "1.2.3+ubuntu.1"),
+        ("v1.2.3+ubuntu-1", "1.2.3+ubuntu.1"),
+        ("v1.2.3+ubuntu_1", "1.2.3+ubuntu.1"),
+    ],
+)
+def test_local(version_str: str, expected: str) -> None:
+    assert str(Version(version_str)) == expected
 
 
 def test_major_minor() -> None:
@@ -239,36 +297,38 @@ def test_major_minor_post() -> None:
     assert str(Version("1.1.dev1")) == "1.1.dev1"
 
 
-def test_date_versions() -> None:
-    assert str(Version("2012.1")) == "2012.1"
-    assert str(Version("2012.2")) == "2012.2"
-    assert str(Version("2012.3")) == "2012.3"
-    assert str(Version("2012.15")) == "2012.15"
-    assert str(Version("2013.1")) == "2013.1"
-    assert str(Version("2013.2")) == "2013.2"
-
-
-def test_possible_combinations() -> None:
-    assert str(Version("1.dev0")) == "1.dev0"
-    assert str(Version("1.0.dev456")) == "1.0.dev456"
-    assert str(Version("1.0a1")) == "1.0a1"
-    assert str(Version("1.0a2.dev456")) == "1.0a2.dev456"
-    assert str(Version("1.0a12.dev456")) == "1.0a12.dev456"
-    assert str(Version("1.0a12")) == "1.0a12"
-    assert str(Version("1.0b1.dev456")) == "1.0b1.dev456"
-    assert str(Version("1.0b2")) == "1.0b2"
-    assert str(Version("1.0b2.post345.dev456")) == "1.0b2.post345.dev456"
-    assert str(Version("1.0b2.post345")) == "1.0b2.post345"
-    assert str(Version("1.0rc1.dev456")) == "1.0rc1.dev456"
-    assert str(Version("1.0rc1")) == "1.0rc1"
-    assert str(Version("1.0")) == "1.0"
-    assert str(Version("1.0+abc.5")) == "1.0+abc.5"
-    assert str(Version("1.0+abc.7")) == "1.0+abc.7"
-    assert str(Version("1.0+5")) == "1.0+5"
-    assert str(Version("1.0.post456.dev34")) == "1.0.post456.dev34"
-    assert str(Version("1.0.post456")) == "1.0.post456"
-    assert str(Version("1.0.15")) == "1.0.15"
-    assert str(Version("1.1.dev1")) == "1.1.dev1"
+@pytest.mark.parametrize("version_str", ["2012.1", "2012.2", "2012.3", "2012.15", "2013.1", "2013.2"])
+def test_date_versions(version_str: str) -> None:
+    assert str(Version(version_str)) == version_str
+
+
+@pytest.mark.parametrize(
+    "version_str",
+    [
+        "1.dev0",
+        "1.0.dev456",
+        "1.0a1",
+        "1.0a2.dev456",
+        "1.0a12.dev456",
+        "1.0a12",
+        "1.0b1.dev456",
+        "1.0b2",
+        "1.0b2.post345.dev456",
+        "1.0b2.post345",
+        "1.0rc1.dev456",
+        "1.0rc1",
+        "1.0",
+        "1.0+abc.5",
+        "1.0+abc.7",
+        "1.0+5",
+        "1.0.post456.dev34",
+        "1.0.post456",
+        "1.0.15",
+        "1.1.dev1",
+    ],
+)
+def test_possible_combinations(version_str: str) -> None:
+    assert str(Version(version_str)) == version_str
 
 
 def test_invalid_version() -> None: